@@ -17,7 +17,7 @@ from .core.test_parameter import (
 from .core.tester import post_tests, pre_tests
 from .core.unittest_wrapper import post_hook, pre_hook
 
-__all__ = [
+__all__ = (
     "gs_connect",
     "problem",
     "param",
@@ -35,4 +35,4 @@ __all__ = [
     "post_hook",
     "pre_hook",
     "pre_tests",
-]
+)
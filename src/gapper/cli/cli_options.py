@@ -1,7 +1,8 @@
 """CLI options for gapper."""
+import logging
 from functools import wraps
 from pathlib import Path
-from time import time
+from time import perf_counter
 from typing import Annotated, List, Optional
 
 import typer
@@ -117,10 +118,12 @@ def timed[T](fn: T) -> T:
 
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        start = time()
+        start = perf_counter()
         result = fn(*args, **kwargs)
-        end = time()
-        cli_logger.debug(f"Time elapsed: {end - start}s")
+        end = perf_counter()
+        # the level is only known after the command sets up the logger
+        if cli_logger.isEnabledFor(logging.DEBUG):
+            cli_logger.debug(f"Time elapsed: {end - start}s")
         return result
 
     return wrapper
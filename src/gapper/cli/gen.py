@@ -20,8 +20,7 @@ from gapper.cli.utils import (
     upload_with_connect_details,
     upload_with_gui,
 )
-from gapper.connect.gui.utils import DEFAULT_LOGIN_SAVE_PATH, add_debug_to_app
-from gapper.core.file_handlers import AutograderZipper
+from gapper.connect.api.utils import DEFAULT_LOGIN_SAVE_PATH
 from gapper.core.injection import InjectionHandler
 from gapper.core.problem import Problem
 from gapper.core.tester import Tester
@@ -41,6 +40,9 @@ def gen(
     ui_debug: UIDebugOpt = False,
 ) -> None:
     """Generate the autograder for a problem."""
+    from gapper.connect.gui.utils import add_debug_to_app
+    from gapper.core.file_handlers import AutograderZipper
+
     add_debug_to_app(ui_debug)
     setup_root_logger(verbose)
 
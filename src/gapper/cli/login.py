@@ -10,8 +10,7 @@ from gapper.cli.cli_options import (
     timed,
 )
 from gapper.cli.utils import check_login_valid, setup_root_logger
-from gapper.connect.api.account import GSAccount
-from gapper.connect.gui.utils import DEFAULT_LOGIN_SAVE_PATH
+from gapper.connect.api.utils import DEFAULT_LOGIN_SAVE_PATH
 
 
 @timed
@@ -30,6 +29,8 @@ def login(
     verbose: VerboseOpt = False,
 ) -> None:
     """Login to Gradescope."""
+    from gapper.connect.api.account import GSAccount
+
     setup_root_logger(verbose)
 
     email = typer.prompt("Enter your gradescope email")
@@ -6,7 +6,6 @@ import typer
 
 from gapper.cli.cli_options import VerboseOpt, timed
 from gapper.cli.utils import cli_logger, setup_root_logger
-from gapper.gradescope.main import run_autograder
 from gapper.gradescope.vars import (
     AUTOGRADER_METADATA,
     AUTOGRADER_OUTPUT,
@@ -38,6 +37,8 @@ def run_in_prod(
     verbose: VerboseOpt = True,
 ) -> None:
     """Run the autograder in production mode."""
+    from gapper.gradescope.main import run_autograder
+
     setup_root_logger(verbose)
 
     cli_logger.debug("Autograder run in production mode")
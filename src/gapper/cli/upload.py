@@ -6,7 +6,7 @@ import typer
 
 from gapper.cli.cli_options import LoginSavePath, UIDebugOpt, timed
 from gapper.cli.utils import upload_with_connect_details, upload_with_gui
-from gapper.connect.gui.utils import DEFAULT_LOGIN_SAVE_PATH, add_debug_to_app
+from gapper.connect.api.utils import DEFAULT_LOGIN_SAVE_PATH
 from gapper.core.problem.extras.gradescope_connect import build_connect_config
 
 upload = typer.Typer(name="upload")
@@ -26,6 +26,8 @@ def gui(
     ui_debug: UIDebugOpt = False,
 ) -> None:
     """Upload an autograder to Gradescope with GUI."""
+    from gapper.connect.gui.utils import add_debug_to_app
+
     add_debug_to_app(ui_debug)
     upload_with_gui(login_save_path, autograder_path)
 
@@ -47,6 +49,8 @@ def url(
     ui_debug: UIDebugOpt = False,
 ) -> None:
     """Upload an autograder to Gradescope using the assignment url."""
+    from gapper.connect.gui.utils import add_debug_to_app
+
     add_debug_to_app(ui_debug)
 
     typer.echo("Using url to upload. Ignoring cid and aid.")
@@ -72,6 +76,8 @@ def ids(
     aid: Annotated[Optional[str], typer.Argument(help="The assignment id.")] = None,
 ) -> None:
     """Upload an autograder to Gradescope using the cid and aid."""
+    from gapper.connect.gui.utils import add_debug_to_app
+
     add_debug_to_app(ui_debug)
 
     typer.echo("Using cid and aid to upload.")
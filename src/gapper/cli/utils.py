@@ -1,15 +1,15 @@
 """Utility functions for CLI commands."""
-import asyncio
+from __future__ import annotations
+
 import logging
 import traceback
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
-from gapper.connect.api.account import GSAccount
-from gapper.connect.api.assignment import GSAssignmentEssential
-from gapper.connect.gui.app_ui import GradescopeConnect
-from gapper.connect.gui.upload_app_ui import AutograderUploadApp
+if TYPE_CHECKING:
+    from gapper.connect.api.account import GSAccount
 
 _package_logger = logging.getLogger("gapper")
 cli_logger = logging.getLogger("gapper.cli")
@@ -20,6 +20,8 @@ def load_account_from_path(login_save_path: Path) -> GSAccount:
 
     :param login_save_path: The path to the login save file.
     """
+    from gapper.connect.api.account import GSAccount
+
     try:
         account = GSAccount.from_yaml(login_save_path).spawn_session()
     except Exception as e:
@@ -43,6 +45,8 @@ def check_login_valid(account: GSAccount) -> None:
 
     :param account: The account to check.
     """
+    import asyncio
+
     try:
         asyncio.run(account.login(remember_me=True))
     except Exception as e:
@@ -64,6 +68,8 @@ def upload_with_gui(login_save_path: Path, autograder_path: Path) -> None:
     :param login_save_path: The path to the login save file.
     :param autograder_path: The path to the autograder zip file.
     """
+    from gapper.connect.gui.app_ui import GradescopeConnect
+
     gs_app = GradescopeConnect(
         login_save_path=login_save_path, autograder_path=autograder_path
     )
@@ -80,6 +86,9 @@ def upload_with_connect_details(
     :param login_save_path: The path to the login save file.
     :param autograder_path: The path to the autograder zip file.
     """
+    from gapper.connect.api.assignment import GSAssignmentEssential
+    from gapper.connect.gui.upload_app_ui import AutograderUploadApp
+
     account = load_account_from_path(login_save_path)
     check_login_valid(account)
 
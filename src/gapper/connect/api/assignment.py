@@ -1,6 +1,7 @@
 """This module contains the classes for Gradescope assignments."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
@@ -8,7 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, TypedDict
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dataclasses_json import dataclass_json
 from requests_toolbelt import MultipartEncoder
 
@@ -17,9 +18,12 @@ from gapper.connect.api.utils import OSChoices
 
 _assignment_logger = logging.getLogger("gapper.connect.api.assignment")
 
-NO_IMAGE_REGEX = re.compile(r"gon\.image *= *null *;?")
 IMAGE_REGEX = re.compile(
-    r"gon\.image *= *{.*\"name\" *: *\"gradescope/autograders:.*-(?P<docker_id>\d+)\""
+    r"gon\.image *= *(?:(?P<no_image>null)"
+    r"|{.*\"name\" *: *\"gradescope/autograders:.*-(?P<docker_id>\d+)\")"
+)
+AUTOGRADER_FORM_STRAINER = SoupStrainer(
+    "form", attrs={"class": re.compile(r"(^|\s)js-autograderForm(\s|$)")}
 )
 
 
@@ -41,6 +45,8 @@ class DockerStatusJson(TypedDict):
 class GSAssignmentEssential(SessionHolder):
     """The essential information of a Gradescope assignment."""
 
+    __slots__ = ("cid", "aid", "docker_id", "_logger", "_authenticity_token")
+
     cid: str
     aid: str
     docker_id: str | None
@@ -65,6 +71,28 @@ class GSAssignmentEssential(SessionHolder):
         self.aid = aid
         self.docker_id = docker_id
         self._logger = _assignment_logger.getChild(f"GSAssignmentEssential_{self.aid}")
+        self._authenticity_token: str | None = None
+
+    def get_authenticity_token(self) -> str:
+        """Get the authenticity token of the autograder configuration form.
+
+        The token is fetched once and reused until an upload is rejected.
+        """
+        if self._authenticity_token is None:
+            autograder_config = self._session.get(
+                f"https://www.gradescope.com/courses/{self.cid}/assignments/{self.aid}/configure_autograder"
+            )
+            # only the autograder form is built into the tree
+            autograder_form = BeautifulSoup(
+                autograder_config.text,
+                "html.parser",
+                parse_only=AUTOGRADER_FORM_STRAINER,
+            )
+            self._authenticity_token = autograder_form.find(
+                "input", attrs={"name": "authenticity_token"}
+            ).get("value")
+
+        return self._authenticity_token
 
     async def upload_autograder(self, path: Path, os_choice: OSChoices) -> None:
         """Upload the autograder to the assignment.
@@ -72,43 +100,46 @@ class GSAssignmentEssential(SessionHolder):
         :param path: The path to the autograder zip file.
         :param os_choice: The choice of the operating system.
         """
-        if not path.exists():
-            raise FileNotFoundError(f"File {path} does not exist when uploading")
-        if not path.is_file() or not path.suffix == ".zip":
+        if path.suffix != ".zip":
             raise ValueError(f"File {path} is not a zip file")
 
-        autograder_config = self._session.get(
-            "https://www.gradescope.com/courses/"
-            + self.cid
-            + "/assignments/"
-            + self.aid
-            + "/configure_autograder"
-        )
-        autograder_config_resp = BeautifulSoup(autograder_config.text, "html.parser")
-        autograder_form = autograder_config_resp.find(
-            "form", attrs={"class": "js-autograderForm"}
-        )
-        authenticity_token = autograder_form.find(
-            "input", attrs={"name": "authenticity_token"}
-        ).get("value")
-
-        autograder_dict: Dict[str, str] = {
-            "utf8": "â",
-            "_method": "patch",
-            "authenticity_token": authenticity_token,
-            "configuration": "zip",
-            "autograder_zip": (path.name, path.read_bytes(), "text/plain"),
-            "base_image_id": str(os_choice.value.id),
-            "assignment[image_name]": os_choice.value.image,
-        }
-
-        multipart = MultipartEncoder(fields=autograder_dict)
-
-        response = self._session.post(
-            f"https://www.gradescope.com/courses/{self.cid}/assignments/{self.aid}/",
-            data=multipart,
-            headers={"Content-Type": multipart.content_type},
-        )
+        try:
+            autograder_zip = path.open("rb")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File {path} does not exist when uploading") from e
+        except IsADirectoryError as e:
+            raise ValueError(f"File {path} is not a zip file") from e
+
+        with autograder_zip:
+            # fetching and parsing the form blocks, so it runs off the event loop as well
+            authenticity_token = await asyncio.to_thread(self.get_authenticity_token)
+
+            autograder_dict: Dict[str, Any] = {
+                "utf8": "â",
+                "_method": "patch",
+                "authenticity_token": authenticity_token,
+                "configuration": "zip",
+                "autograder_zip": (path.name, autograder_zip, "application/zip"),
+                "base_image_id": str(os_choice.value.id),
+                "assignment[image_name]": os_choice.value.image,
+            }
+
+            multipart = MultipartEncoder(fields=autograder_dict)
+
+            # the encoder streams the zip from disk, so keep the blocking post off the event loop
+            response = await asyncio.to_thread(
+                self._session.post,
+                f"https://www.gradescope.com/courses/{self.cid}/assignments/{self.aid}/",
+                data=multipart,
+                headers={"Content-Type": multipart.content_type},
+            )
+
+        if response.status_code in (
+            requests.codes.unauthorized,
+            requests.codes.unprocessable_entity,
+        ):
+            # the token is stale, fetch a new one on the next upload
+            self._authenticity_token = None
 
         if response.status_code != requests.codes.ok:
             raise ValueError(f"Upload failed with status code {response.status_code}")
@@ -117,11 +148,7 @@ class GSAssignmentEssential(SessionHolder):
         """Get the active docker id of the assignment."""
         if self.docker_id is None:
             autograder_config = self._session.get(
-                "https://www.gradescope.com/courses/"
-                + self.cid
-                + "/assignments/"
-                + self.aid
-                + "/configure_autograder"
+                f"https://www.gradescope.com/courses/{self.cid}/assignments/{self.aid}/configure_autograder"
             )
 
             if autograder_config.status_code != requests.codes.ok:
@@ -131,11 +158,8 @@ class GSAssignmentEssential(SessionHolder):
                 return None
 
             self._logger.debug("Got autograder config")
-            self._logger.debug(autograder_config.text)
-
-            if NO_IMAGE_REGEX.search(autograder_config.text) is not None:
-                self._logger.debug("No image found")
-                return None
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(autograder_config.text)
 
             id_match = IMAGE_REGEX.search(autograder_config.text)
             if id_match is None:
@@ -145,7 +169,11 @@ class GSAssignmentEssential(SessionHolder):
                 )
                 return None
 
-            self.docker_id = id_match.groupdict()["docker_id"]
+            if id_match["no_image"] is not None:
+                self._logger.debug("No image found")
+                return None
+
+            self.docker_id = id_match["docker_id"]
 
         return self.docker_id
 
@@ -159,6 +187,10 @@ class GSAssignmentEssential(SessionHolder):
             f"https://www.gradescope.com/courses/{self.cid}/assignments/{self.aid}/docker_images/{docker_id}.json"
         ).json()
 
+    async def aget_docker_build_status(self) -> DockerStatusJson | None:
+        """Get the docker build status of the assignment without blocking the event loop."""
+        return await asyncio.to_thread(self.get_docker_build_status)
+
     def __eq__(self, other: Any) -> bool:
         """Check if two GSAssignments are equal."""
         if isinstance(other, GSAssignmentEssential):
@@ -174,6 +206,17 @@ class GSAssignmentEssential(SessionHolder):
 class GSAssignment(GSAssignmentEssential):
     """The Gradescope assignment with detailed information."""
 
+    __slots__ = (
+        "name",
+        "points",
+        "submissions",
+        "percent_graded",
+        "published",
+        "release_date",
+        "due_date",
+        "hard_due_date",
+    )
+
     name: str
     points: str
     submissions: str
@@ -3,11 +3,15 @@ from typing import Dict, Optional, Self
 
 import requests
 from dataclasses_json import config, dataclass_json
+from requests.adapters import HTTPAdapter
 from requests.utils import cookiejar_from_dict, dict_from_cookiejar
+from urllib3 import Retry
+
+GRADESCOPE_URL_PREFIX = "https://www.gradescope.com"
 
 
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class SessionHolder:
     _session: Optional[requests.Session] = field(
         metadata=config(exclude=lambda x: True), init=False, default=None
@@ -26,6 +30,16 @@ class SessionHolder:
 
     def spawn_session(self) -> Self:
         self._session = requests.Session()
+        # keep connections to gradescope alive across polls and retry flaky GETs.
+        # POSTs are not retried by urllib3 by default, so uploads are never resent
+        self._session.mount(
+            GRADESCOPE_URL_PREFIX,
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=10,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            ),
+        )
         return self
 
     def no_verify(self) -> Self:
@@ -0,0 +1,122 @@
+"""This module contains the shared poller of Gradescope docker build statuses."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import ClassVar, Dict, List, Self, Tuple
+
+from gapper.connect.api.assignment import DockerStatusJson, GSAssignmentEssential
+
+_status_poller_logger = logging.getLogger("gapper.connect.api.status_poller")
+
+# a failed request puts its exception into the queue instead of a status
+StatusQueue = asyncio.Queue[DockerStatusJson | None | Exception]
+
+
+class StatusPoller:
+    """Poll the docker build statuses of assignments in one place.
+
+    Every assignment is requested once per tick no matter how many subscribers are
+    waiting on it, and the statuses are fanned out to the subscribers' queues.
+    """
+
+    _instance: ClassVar[StatusPoller | None] = None
+
+    def __init__(self, initial_interval: float = 1, max_interval: float = 15) -> None:
+        """Create a status poller.
+
+        :param initial_interval: The seconds to wait after the first poll.
+        :param max_interval: The cap of the seconds between polls.
+            The interval doubles after each poll until it reaches this cap.
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self._assignments: Dict[Tuple[str, str], GSAssignmentEssential] = {}
+        self._subscribers: Dict[Tuple[str, str], List[StatusQueue]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._wake_up: asyncio.Event | None = None
+
+    @classmethod
+    def instance(cls) -> Self:
+        """Get the poller shared in this process."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def subscribe(self, assignment: GSAssignmentEssential) -> StatusQueue:
+        """Subscribe to the docker build status of an assignment.
+
+        This has to be called while an event loop is running.
+
+        :param assignment: The assignment to poll the status of.
+        :return: The queue the polled statuses, or the errors of failed polls,
+            are put into.
+        """
+        key = (assignment.cid, assignment.aid)
+        queue: StatusQueue = asyncio.Queue()
+
+        self._assignments.setdefault(key, assignment)
+        self._subscribers.setdefault(key, []).append(queue)
+        _status_poller_logger.debug(f"Subscribed to docker status of {key}")
+
+        if self._task is None or self._task.done():
+            self._wake_up = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+        else:
+            # a new subscriber should not wait for a long backoff interval
+            self._wake_up.set()
+
+        return queue
+
+    def unsubscribe(
+        self, assignment: GSAssignmentEssential, queue: StatusQueue
+    ) -> None:
+        """Stop putting the docker build status of an assignment into a queue.
+
+        :param assignment: The assignment subscribed to.
+        :param queue: The queue returned by :meth:`subscribe`.
+        """
+        key = (assignment.cid, assignment.aid)
+        queues = self._subscribers.get(key, [])
+        if queue in queues:
+            queues.remove(queue)
+
+        if not queues:
+            self._subscribers.pop(key, None)
+            self._assignments.pop(key, None)
+
+        if not self._subscribers and self._wake_up is not None:
+            # let the polling task notice there is no one left
+            self._wake_up.set()
+
+        _status_poller_logger.debug(f"Unsubscribed from docker status of {key}")
+
+    async def _poll(self) -> None:
+        assert self._wake_up is not None
+        interval = self.initial_interval
+
+        while self._subscribers:
+            self._wake_up.clear()
+            keys = list(self._assignments)
+            statuses = await asyncio.gather(
+                *(self._assignments[key].aget_docker_build_status() for key in keys),
+                return_exceptions=True,
+            )
+
+            for key, status in zip(keys, statuses):
+                if isinstance(status, Exception):
+                    _status_poller_logger.warning(
+                        f"Failed to get docker status of {key}: {status}"
+                    )
+
+                for queue in self._subscribers.get(key, []):
+                    queue.put_nowait(status)
+
+            try:
+                await asyncio.wait_for(self._wake_up.wait(), interval)
+            except asyncio.TimeoutError:
+                interval = min(interval * 2, self.max_interval)
+            else:
+                interval = self.initial_interval
+
+        _status_poller_logger.debug("No subscriber left, stopped polling")
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import enum
 import re
+from pathlib import Path
 from typing import NamedTuple
 
+LOGIN_SAVE_FILE_NAME = "gs_account.yaml"
+
+DEFAULT_LOGIN_SAVE_PATH = Path.home() / ".config/gapper/" / LOGIN_SAVE_FILE_NAME
+
 SUBMIT_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M"
 PARSE_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%:z"
 
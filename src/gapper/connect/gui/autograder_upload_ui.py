@@ -1,7 +1,6 @@
 import traceback
 from pathlib import Path
-from threading import Timer
-from typing import Callable, cast
+from types import TracebackType
 
 import typer
 from rich.text import Text
@@ -10,35 +9,17 @@ from textual.app import ComposeResult
 from textual.containers import Container, ScrollableContainer
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Label, Select
+from textual.worker import Worker
 
 from gapper.connect.api.assignment import (
     DockerStatusJson,
     GSAssignment,
     GSAssignmentEssential,
 )
+from gapper.connect.api.status_poller import StatusPoller
 from gapper.connect.api.utils import OSChoices
 
 
-class Repeat[**P, T](Timer):
-    def __init__(
-        self,
-        interval: float | int,
-        function: Callable[P, T],
-        args=None,
-        kwargs=None,
-        call_immediately: bool = False,
-    ) -> None:
-        super().__init__(interval, function, args, kwargs)
-        self.call_immediately = call_immediately
-
-    def run(self):
-        if self.call_immediately:
-            self.function(*self.args, **self.kwargs)
-
-        while not self.finished.wait(self.interval):
-            self.function(*self.args, **self.kwargs)
-
-
 class AutograderUploadScreen(Screen):
     BINDINGS = [("ctrl+b", "go_back", "Go Back"), ("ctrl+q", "quit", "Quit")]
 
@@ -54,7 +35,14 @@ class AutograderUploadScreen(Screen):
         super().__init__(*args, **kwargs)
         self.assignment = assignment
         self.autograder_path = autograder_path
-        self.upload_info_timer: Timer | None = None
+        self.upload_info_worker: Worker[None] | None = None
+        self._os_select: Select[OSChoices] | None = None
+        self._info_label: Label | None = None
+        self._error_label: Label | None = None
+        self._last_error_message: str | None = None
+        self._last_tb: TracebackType | None = None
+        self._last_info: str | None = None
+        self._last_error: str | None = None
 
     @property
     def assignment_name(self) -> str:
@@ -71,11 +59,14 @@ class AutograderUploadScreen(Screen):
 
     def compose(self) -> ComposeResult:
         """Compose the autograder upload screen."""
+        assignment_name = self.assignment_name
+        full_autograder_path = self.full_autograder_path
+
         yield Header()
         yield Container(
             Label("Uploading Autograder For"),
-            Label(f"Assignment: '{self.assignment_name}'"),
-            Label(f"Autograder Path: '{self.full_autograder_path}'"),
+            Label(f"Assignment: '{assignment_name}'"),
+            Label(f"Autograder Path: '{full_autograder_path}'"),
         )
         yield Container(
             Label("Autograder OS:"),
@@ -88,6 +79,7 @@ class AutograderUploadScreen(Screen):
         yield Container(
             Button("Upload", id="upload_btn"),
             Button("Open In Browser", id="open_assignment_btn"),
+            Button("Error Details", id="error_details_btn"),
             id="btn_controls",
         )
         yield Container(Label("Info"), ScrollableContainer(Label(id="info_label")))
@@ -95,6 +87,12 @@ class AutograderUploadScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Look up the widgets updated by the screen once."""
+        self._os_select = self.query_one("#os_select", Select)
+        self._info_label = self.query_one("#info_label", Label)
+        self._error_label = self.query_one("#error_label", Label)
+
     @on(Button.Pressed, "#open_assignment_btn")
     async def open_assignment(self) -> None:
         """Open the assignment in the browser."""
@@ -108,63 +106,115 @@ class AutograderUploadScreen(Screen):
     @on(Button.Pressed, "#upload_btn")
     async def uploads(self) -> None:
         """Upload the autograder to the assignment with selected OS."""
-        select: Select[OSChoices] = cast(
-            Select[OSChoices], self.get_widget_by_id("os_select")
-        )
-
-        info_label = cast(Label, self.get_widget_by_id("info_label"))
-        error_label = cast(Label, self.get_widget_by_id("error_label"))
-
-        if select is None:
-            error_label.update("The autograder OS is unset.")
+        if self._os_select.value is None:
+            self._error_label.update("The autograder OS is unset.")
             return
 
         try:
-            await self.assignment.upload_autograder(self.autograder_path, select.value)
-            info_label.update("Uploaded autograder successfully.")
+            await self.assignment.upload_autograder(
+                self.autograder_path, self._os_select.value
+            )
+            self._info_label.update("Uploaded autograder successfully.")
         except Exception as e:
-            error_label.update(
+            # the traceback is only formatted when the details are asked for
+            self._last_error_message = (
                 "Cannot upload autograder due to Error.\n"
-                f"{e}\n"
-                f"{traceback.format_tb(e.__traceback__)}"
+                f"{''.join(traceback.format_exception_only(e)).rstrip()}"
             )
+            self._last_tb = e.__traceback__
+            self._error_label.update(Text(self._last_error_message))
         else:
-            self.upload_info_timer = Repeat(
-                1,
-                lambda: self.run_worker(self.refresh_upload_info()),
-                call_immediately=True,
+            self._last_error_message = self._last_tb = None
+            self.upload_info_worker = self.run_worker(
+                self.poll_upload_info(), exclusive=True
+            )
+
+    @on(Button.Pressed, "#error_details_btn")
+    def show_error_details(self) -> None:
+        """Show the traceback of the last upload error."""
+        if self._last_error_message is None:
+            self._error_label.update("No upload error to show details of.")
+            return
+
+        self._error_label.update(
+            Text(
+                f"{self._last_error_message}\n"
+                f"{''.join(traceback.format_tb(self._last_tb))}"
             )
-            self.upload_info_timer.start()
+        )
+
+    def cancel_upload_info_polling(self) -> None:
+        """Stop polling the docker build status."""
+        if self.upload_info_worker:
+            self.upload_info_worker.cancel()
+            self.upload_info_worker = None
 
     async def action_go_back(self) -> None:
         """Go back to the previous screen."""
-        if self.upload_info_timer:
-            self.upload_info_timer.cancel()
-
+        self.cancel_upload_info_polling()
         await self.app.action_pop_screen()
 
     async def action_quit(self) -> None:
         """Quit the application."""
-        if self.upload_info_timer:
-            self.upload_info_timer.cancel()
-
+        self.cancel_upload_info_polling()
         await self.app.action_quit()
 
-    async def refresh_upload_info(self) -> None:
+    async def poll_upload_info(self) -> None:
+        """Refresh the upload info until the docker image is built."""
+        poller = StatusPoller.instance()
+        status_queue = poller.subscribe(self.assignment)
+        # the labels were updated by the upload, so the first status is always shown
+        self._last_info = self._last_error = None
+        try:
+            while not self.refresh_upload_info(await status_queue.get()):
+                pass
+        finally:
+            poller.unsubscribe(self.assignment, status_queue)
+
+        self.log.debug("Stopped polling upload info")
+
+    def refresh_upload_info(
+        self, docker_status: DockerStatusJson | None | Exception
+    ) -> bool:
+        """Refresh the upload info with the docker build status.
+
+        :param docker_status: The polled docker build status, or the error of the poll.
+        :return: Whether the docker image is built.
+        """
         self.log.debug("Refreshing upload info")
-        error_label = cast(Label, self.get_widget_by_id("error_label"))
-        info_label = cast(Label, self.get_widget_by_id("info_label"))
-        docker_status: DockerStatusJson = self.assignment.get_docker_build_status()
         self.log.debug(f"Got docker status: {docker_status}")
 
-        if docker_status["status"] == "built":
+        if isinstance(docker_status, Exception):
+            # keep polling, the status endpoint may recover
+            self._update_error(
+                f"Cannot get the docker build status due to Error.\n{docker_status}"
+            )
+            return False
+
+        if docker_status is None:
+            self._update_info("Waiting for the docker image to be created")
+            return False
+
+        is_built = docker_status["status"] == "built"
+        if is_built:
             self.log.debug("Docker image built successfully")
-            self.upload_info_timer.cancel()
             info_header = "Docker image built"
         else:
             info_header = "Docker image building"
 
-        info_label.update(Text(f'{info_header}\n{docker_status["stdout"]}'))
-        error_label.update(Text(docker_status["stderr"] or "No Error"))
+        self._update_info(f'{info_header}\n{docker_status["stdout"]}')
+        self._update_error(docker_status["stderr"] or "No Error")
 
         self.log.debug("Refreshed upload info")
+        return is_built
+
+    def _update_info(self, info: str) -> None:
+        # the docker output is often the same across polls, so skip the re-render
+        if info != self._last_info:
+            self._info_label.update(Text(info))
+            self._last_info = info
+
+    def _update_error(self, error: str) -> None:
+        if error != self._last_error:
+            self._error_label.update(Text(error))
+            self._last_error = error
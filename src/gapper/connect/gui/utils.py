@@ -1,14 +1,14 @@
 import os
-from pathlib import Path
 
 from textual.features import parse_features
 from textual.validation import Regex
 
-EMAIL_VALIDATE_REGEX = Regex(r"^[\w-\.]+@([\w-]+\.)+[\w-]{2,4}$")
-
-LOGIN_SAVE_FILE_NAME = "gs_account.yaml"
+from gapper.connect.api.utils import (  # noqa: F401
+    DEFAULT_LOGIN_SAVE_PATH,
+    LOGIN_SAVE_FILE_NAME,
+)
 
-DEFAULT_LOGIN_SAVE_PATH = Path.home() / ".config/gapper/" / LOGIN_SAVE_FILE_NAME
+EMAIL_VALIDATE_REGEX = Regex(r"^[\w-\.]+@([\w-]+\.)+[\w-]{2,4}$")
 
 
 def add_debug_to_app(flag: bool) -> None:
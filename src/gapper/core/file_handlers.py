@@ -1,6 +1,7 @@
 """A module to handle the autograder zip file generation."""
 import importlib.resources
 import logging
+from functools import cache
 from pathlib import Path
 from sys import version_info
 from tempfile import TemporaryDirectory
@@ -14,6 +15,22 @@ from gapper.gradescope.vars import DEFAULT_TESTER_PICKLE_NAME
 _zip_logger = logging.getLogger("gapper.zip")
 
 
+@cache
+def _render_setup_sh() -> str:
+    """Render the setup.sh script for the running python version.
+
+    The script only depends on the python version, so it is rendered once per process.
+    """
+    template_content = (
+        importlib.resources.files("gapper.gradescope.resources")
+        .joinpath("setup.j2")
+        .read_text()
+    )
+    return jinja2.Template(template_content).render(
+        py_minor=version_info.minor, py_major=version_info.major
+    )
+
+
 class AutograderZipper:
     def __init__(self, tester: Tester) -> None:
         """A class to generate the autograder zip file.
@@ -47,15 +64,7 @@ class AutograderZipper:
         with importlib.resources.as_file(
             importlib.resources.files("gapper.gradescope.resources")
         ) as resource_folder:
-            with open(resource_folder / "setup.j2", "r") as setup_file:
-                template_content = setup_file.read()
-                setup_sh_template = jinja2.Template(template_content)
-
-            setup_shell_script = setup_sh_template.render(
-                py_minor=version_info.minor, py_major=version_info.major
-            )
-
-            zip_file.writestr("setup.sh", setup_shell_script)
+            zip_file.writestr("setup.sh", _render_setup_sh())
 
             for file in resource_folder.iterdir():
                 if file.name in self.gs_setup_files:
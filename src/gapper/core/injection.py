@@ -5,17 +5,21 @@ problem definition script and be used in testing.
 """
 import importlib.util
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import ModuleType
-from typing import Optional, Self, Sequence, Set
+from typing import Dict, List, Optional, Self, Sequence, Tuple
 
 _injection_logger = logging.getLogger("gapper.injection")
 
+# loaded injection files keyed by (resolved path, modification time in ns, size)
+_INJECT_CACHE: Dict[Tuple[str, int, int], Tuple[ModuleType, Tuple[str, ...]]] = {}
+
 
 @dataclass
 class InjectionHandler:
-    content_to_be_injected: Set[Path] = field(default_factory=set)
+    content_to_be_injected: Dict[str, Path] = field(default_factory=dict)
     injection_module_name: str = field(default="injection")
     auto_injected_folder_name: str = field(default="gap_injection")
     injection_module_flag: str = field(default="__gap_injection_module__")
@@ -37,7 +41,9 @@ class InjectionHandler:
                 auto_inject if isinstance(auto_inject, Path) else None
             )
         if inject_module_paths:
-            self.content_to_be_injected.update(inject_module_paths)
+            self.content_to_be_injected.update(
+                {os.fspath(path.resolve()): path for path in inject_module_paths}
+            )
 
         return self
 
@@ -48,11 +54,7 @@ class InjectionHandler:
         inject files must but files
         inject dirs must be directories
         """
-        for content in self.content_to_be_injected:
-            if not content.exists():
-                return False
-
-        return True
+        return all(map(os.path.exists, self.content_to_be_injected))
 
     def create_injection_module(self) -> ModuleType:
         """Create the injection module.
@@ -91,9 +93,20 @@ class InjectionHandler:
         if not module:
             raise ValueError("No module to inject into.")
 
-        for file_path in self.content_to_be_injected:
-            _injection_logger.debug(f"Injecting {file_path.absolute()} into {module}.")
-            _inject_content(module, file_path)
+        injection_files: List[str] = []
+        for resolved_path in self.content_to_be_injected:
+            _injection_logger.debug(f"Injecting {resolved_path} into {module}.")
+            injection_files.extend(_collect_injection_files(resolved_path))
+
+        # each file is merged before the next one is loaded,
+        # so it can import what the earlier files have injected
+        for file_path in injection_files:
+            temp_module, wanted_properties = _load_injection_file(file_path)
+            temp_vars = vars(temp_module)
+            vars(module).update((name, temp_vars[name]) for name in wanted_properties)
+            _injection_logger.debug(
+                f"Injected {wanted_properties} from {file_path} into {module}"
+            )
 
     def find_auto_injection(self, path: Path | None = None) -> None:
         """Find the auto injection folder.
@@ -106,82 +119,112 @@ class InjectionHandler:
             f"Start searching for auto injection folder from {path.absolute()}."
         )
 
-        self.content_to_be_injected.add(
-            _find_injection_dir(self.auto_injected_folder_name, path)
-        )
+        injection_dir = _find_injection_dir(self.auto_injected_folder_name, path)
+        self.content_to_be_injected[os.fspath(injection_dir.resolve())] = injection_dir
         _injection_logger.debug(
             f"Content to be injected updated to {self.content_to_be_injected}"
         )
 
 
-def _grab_user_defined_properties(module: ModuleType) -> Set[str]:
+def _grab_user_defined_properties(module: ModuleType) -> Sequence[str]:
     """Grab all the properties defined in the module."""
     if hasattr(module, "__all__"):
-        return set(module.__all__)
+        return module.__all__
     else:
-        return {name for name in dir(module) if not name.startswith("_")}
+        return [name for name in vars(module) if not name.startswith("_")]
 
 
-def _inject_content(module: Optional[ModuleType], content_path: Path) -> None:
-    if content_path.is_dir():
-        _injection_logger.debug(
-            "Path {content_path} is a directory, injecting recursively."
+def _collect_injection_files(content_path: str) -> List[str]:
+    """Collect the python files to be injected from a file or a directory.
+
+    :param content_path: The resolved path of the file or the directory to collect from.
+    :return: The paths of the python files, in the order they are injected.
+    """
+    injection_files: List[str] = []
+    if os.path.isdir(content_path):
+        _collect_injection_dir(content_path, injection_files)
+    elif os.path.isfile(content_path):
+        _collect_injection_file(content_path, injection_files)
+
+    return injection_files
+
+
+def _collect_injection_dir(dir_path: str, injection_files: List[str]) -> None:
+    _injection_logger.debug(f"Path {dir_path} is a directory, injecting recursively.")
+
+    # the entry types come from the directory listing, saving a stat per entry
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                _collect_injection_dir(entry.path, injection_files)
+            elif entry.is_file():
+                _collect_injection_file(entry.path, injection_files)
+
+
+def _collect_injection_file(file_path: str, injection_files: List[str]) -> None:
+    if not file_path.endswith(".py"):
+        _injection_logger.warning(
+            f"Skipping {os.path.abspath(file_path)} as it is not a python file"
         )
+        return
 
-        for sub_content in content_path.iterdir():
-            _inject_content(module, sub_content)
-    elif content_path.is_file():
-        _injection_logger.debug(f"Path {content_path.absolute()} is a file, injecting.")
+    _injection_logger.debug(f"Path {os.path.abspath(file_path)} is a file, injecting.")
+    injection_files.append(file_path)
 
-        if content_path.suffix != ".py":
-            _injection_logger.warning(
-                f"Skipping {content_path.absolute()} as it is not a python file"
-            )
-            return
 
-        spec = importlib.util.spec_from_file_location(content_path.name, content_path)
-        if not spec:
-            raise ValueError(f"Unable to load file {content_path} for injection")
+def _load_injection_file(
+    content_path: str,
+) -> Tuple[ModuleType, Tuple[str, ...]]:
+    """Load a file to be injected, reusing the result if the file is unchanged.
 
-        temp_module = importlib.util.module_from_spec(spec)
+    :param content_path: The resolved path to the python file.
+    :return: The loaded module and the names of the properties to inject.
+    """
+    # the size catches edits within one tick of a coarse modification time
+    content_stat = os.stat(content_path)
+    cache_key = (content_path, content_stat.st_mtime_ns, content_stat.st_size)
+    if (cached := _INJECT_CACHE.get(cache_key)) is not None:
+        _injection_logger.debug(f"Reusing loaded injection file {content_path}.")
+        return cached
 
-        if spec.loader is None:
-            raise RuntimeError("Unable to load file for injection due to None loader")
+    spec = importlib.util.spec_from_file_location(
+        os.path.basename(content_path), content_path
+    )
+    if not spec:
+        raise ValueError(f"Unable to load file {content_path} for injection")
 
-        spec.loader.exec_module(temp_module)
-        wanted_properties = _grab_user_defined_properties(temp_module)
+    temp_module = importlib.util.module_from_spec(spec)
 
-        for wanted_property in wanted_properties:
-            setattr(module, wanted_property, getattr(temp_module, wanted_property))
-            _injection_logger.debug(
-                f"Injected {wanted_property} from {content_path} into {module}"
-            )
+    if spec.loader is None:
+        raise RuntimeError("Unable to load file for injection due to None loader")
 
+    spec.loader.exec_module(temp_module)
+    wanted_properties = tuple(_grab_user_defined_properties(temp_module))
 
-def _find_injection_dir(injection_dir: str, starting_dir: Optional[Path]) -> Path:
-    """Find the injection directory."""
-    target_folder = current_path = starting_dir
+    _INJECT_CACHE[cache_key] = temp_module, wanted_properties
+    return temp_module, wanted_properties
 
-    # sort of wrong, but it's ok, who will make a folder in the root
-    while current_path != current_path.parent:
-        if (target_folder := current_path / injection_dir).exists():
-            break
 
-        _injection_logger.debug(
-            f"Did not find {injection_dir} in {current_path.absolute()}."
-        )
+def _find_injection_dir(injection_dir: str, starting_dir: Path) -> Path:
+    """Find the injection directory.
 
-        current_path = current_path.parent
+    The starting directory and each of its parents are searched in turn.
+    """
+    current_dir = os.path.abspath(starting_dir)
 
-    if not target_folder.exists():
-        raise ValueError(
-            "No injection directory found. It's likely to be an config error. "
-        )
+    while True:
+        target_folder = os.path.join(current_dir, injection_dir)
+        if os.path.isdir(target_folder):
+            _injection_logger.debug(f"Found injection directory at {target_folder}.")
+            return Path(target_folder)
 
-    if not target_folder.is_dir():
-        raise ValueError(
-            f"Injection directory ({target_folder.absolute()}) is not a directory"
-        )
+        _injection_logger.debug(f"Did not find {injection_dir} in {current_dir}.")
+
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            break
+        current_dir = parent_dir
 
-    _injection_logger.debug(f"Found injection directory at {target_folder.absolute()}.")
-    return target_folder
+    raise ValueError(
+        "No injection directory found. It's likely to be an config error. "
+    )
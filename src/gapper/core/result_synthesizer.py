@@ -33,7 +33,8 @@ class ResultSynthesizer:
         :param metadata: The metadata of the submission.
         :param total_score: The total score of the assignment.
         """
-        self._results: List[TestResult] = results or []
+        # copied so that the synthesizer never extends the caller's list
+        self._results: List[TestResult] = list(results) if results else []
         self._metadata = metadata
         self._total_score = total_score
         self._logger = logging.getLogger("ResultSynthesizer")
@@ -65,6 +66,37 @@ class ResultSynthesizer:
         else:
             return self._total_score
 
+    @staticmethod
+    def _synthesize_score_of(res: TestResult) -> None:
+        """Settle the score of a single result whose max_score is known.
+
+        :param res: The result to settle the score of.
+        """
+        score = res.score
+        if score is not None:
+            if score < 0:
+                raise InternalError(
+                    f"Test {res.rich_test_name} has a negative score ({score})."
+                )
+
+            if res.is_passed and res.extra_points is not None:
+                score += res.extra_points
+        else:
+            if res.max_score is None:
+                raise InternalError(
+                    f"TestResult has to have max_score set, but {res.rich_test_name} does not."
+                )
+
+            # interpret score with pass status
+            if res.pass_status == "passed":
+                score = res.max_score + (
+                    0 if res.extra_points is None else res.extra_points
+                )
+            else:
+                score = 0
+
+        res.score = score
+
     @staticmethod
     def synthesize_score_for(*, results: List[TestResult], total_score: float) -> float:
         """Synthesize the score from the results.
@@ -72,26 +104,28 @@ class ResultSynthesizer:
         :param results: The results to synthesize the score from.
         :param total_score: The total score of the assignment.
         """
-        results_with_score = []
         results_with_weight = []
 
         max_score_sum = 0.0
         weight_sum = 0
 
         for res in results:
-            if res.max_score is not None and res.weight is not None:
+            max_score, weight = res.max_score, res.weight
+
+            if max_score is not None and weight is not None:
                 raise InternalError(
                     "The max_score and weight of a test (result) cannot both be set. "
                     f"But case `{res.rich_test_name}` has both being set. "
-                    f"max_score: {res.max_score}, weight: {res.weight}."
+                    f"max_score: {max_score}, weight: {weight}."
                 )
 
-            if res.max_score is not None:
-                results_with_score.append(res)
-                max_score_sum += res.max_score
-            elif res.weight is not None:
+            if max_score is not None:
+                max_score_sum += max_score
+                # settled right away, the weighted ones once their max_score is derived
+                ResultSynthesizer._synthesize_score_of(res)
+            elif weight is not None:
                 results_with_weight.append(res)
-                weight_sum += res.weight
+                weight_sum += weight
             else:
                 raise InternalError(
                     f"The max_score and weight of a test (result) cannot both be None. "
@@ -110,29 +144,9 @@ class ResultSynthesizer:
             assert res.weight is not None
             res.max_score = res.weight * remaining_score / weight_sum
             res.weight = None
+            ResultSynthesizer._synthesize_score_of(res)
 
-        for res in results:
-            if res.score is not None:
-                if res.score < 0:
-                    raise InternalError(
-                        f"Test {res.rich_test_name} has a negative score ({res.score})."
-                    )
-
-                if res.is_passed and res.extra_points is not None:
-                    res.score += res.extra_points
-            else:
-                assert (
-                    res.max_score is not None
-                ), f"TestResult has to have max_score set, but {res.rich_test_name} does not."
-
-                # interpret score with pass status
-                if res.pass_status == "passed":
-                    res.score = res.max_score + (
-                        0 if res.extra_points is None else res.extra_points
-                    )
-                else:
-                    res.score = 0
-
+        # summed in the given order with sum(), which compensates float errors
         return sum((res.score for res in results), 0.0)
 
     def synthesize_score(self) -> float:
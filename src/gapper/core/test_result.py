@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from gapper.gradescope.datatypes.gradescope_output import PassStateType
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Test result for a single test case.
 
@@ -41,8 +41,7 @@ class TestResult:
     def rich_test_name(self) -> str:
         """The name of the test, with the default name prepended if the name is unset."""
         name = f"{self.name} " if self.name else ""
-        default_name = self.default_name
-        return "{}{}".format(name, default_name)
+        return f"{name}{self.default_name}"
 
     @property
     def rich_test_output(self) -> str:
@@ -51,14 +50,14 @@ class TestResult:
 
         description_info = indent("\n".join(self.descriptions), " " * 2)
         description_msg = (
-            "Description(s): \n" + description_info if self.descriptions else ""
+            f"Description(s): \n{description_info}" if self.descriptions else ""
         )
 
         error_info = indent(
             "\n".join(err.format() for err in self.errors),
             " " * 2,
         )
-        error_msg = "Error(s): \n" + error_info if self.errors else ""
+        error_msg = f"Error(s): \n{error_info}" if self.errors else ""
 
         messages = list(filter(bool, [pass_status_msg, description_msg, error_msg]))
         if len(messages) == 0:
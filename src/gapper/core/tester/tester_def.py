@@ -226,7 +226,7 @@ class Tester[ProbInputType, ProbOutputType](HookHolder, ModuleLoader):
             PostTestsData(test_results=test_results, metadata=metadata),
         )
         self.tear_down_hooks(HookTypes.PRE_TESTS)
-        self.tear_down_hooks(HookTypes.PRE_TESTS)
+        self.tear_down_hooks(HookTypes.POST_TESTS)
 
         return [*pre_results, *test_results, *post_test_result]
 
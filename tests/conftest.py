@@ -1,7 +1,8 @@
 import importlib.util
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Any, Generator, List
+from typing import Any, Generator, List, Tuple
 
 import pytest
 from gapper.core.problem import Problem
@@ -64,10 +65,13 @@ def generate_problem_fixtures(problem_path: Path) -> None:
     setattr(sys.modules[__name__], tester_name, _tester_wrapper)
 
 
-def preset_problem_paths() -> Generator[Path, None, None]:
-    for prob_path in TEST_PROBLEM_FOLDER.iterdir():
-        if prob_path.is_file() and prob_path.suffix == ".py":
-            yield prob_path
+@cache
+def preset_problem_paths() -> Tuple[Path, ...]:
+    return tuple(
+        prob_path
+        for prob_path in TEST_PROBLEM_FOLDER.iterdir()
+        if prob_path.is_file() and prob_path.suffix == ".py"
+    )
 
 
 for _prob_path in preset_problem_paths():
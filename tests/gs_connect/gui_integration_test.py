@@ -216,5 +216,5 @@ async def test_autograder_upload(
 
         success_callback_spy.assert_called_once()
 
-        # cancel timer to avoid error in teardown
-        upload_screen.upload_info_timer.cancel()
+        # stop polling to avoid error in teardown
+        upload_screen.cancel_upload_info_polling()
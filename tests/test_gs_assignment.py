@@ -0,0 +1,112 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from gapper.connect.api.assignment import GSAssignmentEssential
+from gapper.connect.api.utils import OSChoices
+
+CONFIGURE_AUTOGRADER_PAGE = """
+<html>
+<body>
+  <form class="js-searchForm" action="/search">
+    <input type="hidden" name="authenticity_token" value="search-token" />
+  </form>
+  <form class="form js-autograderForm" action="/courses/1/assignments/2">
+    <input type="hidden" name="authenticity_token" value="autograder-token" />
+  </form>
+</body>
+</html>
+"""
+
+
+def _mock_session(*upload_status_codes: int) -> MagicMock:
+    session = MagicMock()
+    session.get.return_value = MagicMock(
+        status_code=requests.codes.ok, text=CONFIGURE_AUTOGRADER_PAGE
+    )
+    session.post.side_effect = [
+        MagicMock(status_code=status_code) for status_code in upload_status_codes
+    ]
+    return session
+
+
+def _upload(assignment: GSAssignmentEssential, autograder_path: Path) -> None:
+    asyncio.run(assignment.upload_autograder(autograder_path, OSChoices.UbuntuV2204))
+
+
+@pytest.fixture()
+def autograder_path(tmp_path: Path) -> Path:
+    path = tmp_path / "autograder.zip"
+    path.write_bytes(b"zip content")
+    return path
+
+
+def test_authenticity_token_comes_from_autograder_form() -> None:
+    assignment = GSAssignmentEssential("1", "2", session=_mock_session())
+
+    assert assignment.get_authenticity_token() == "autograder-token"
+
+
+def test_authenticity_token_is_fetched_once(autograder_path: Path) -> None:
+    session = _mock_session(requests.codes.ok, requests.codes.ok)
+    assignment = GSAssignmentEssential("1", "2", session=session)
+
+    _upload(assignment, autograder_path)
+    _upload(assignment, autograder_path)
+
+    assert session.get.call_count == 1
+    for call in session.post.call_args_list:
+        assert call.kwargs["data"].fields["authenticity_token"] == "autograder-token"
+
+
+@pytest.mark.parametrize(
+    "rejected_status_code",
+    [requests.codes.unauthorized, requests.codes.unprocessable_entity],
+)
+def test_authenticity_token_is_refetched_after_rejection(
+    autograder_path: Path, rejected_status_code: int
+) -> None:
+    session = _mock_session(rejected_status_code, requests.codes.ok)
+    assignment = GSAssignmentEssential("1", "2", session=session)
+
+    with pytest.raises(ValueError, match="Upload failed with status code"):
+        _upload(assignment, autograder_path)
+    _upload(assignment, autograder_path)
+
+    assert session.get.call_count == 2
+
+
+def _docker_page_session(page: str) -> MagicMock:
+    session = MagicMock()
+    session.get.return_value = MagicMock(status_code=requests.codes.ok, text=page)
+    return session
+
+
+def test_active_docker_id_with_null_image() -> None:
+    page = "<script>gon.image = null;</script>"
+    assignment = GSAssignmentEssential("1", "2", session=_docker_page_session(page))
+
+    assert assignment.get_active_docker_id() is None
+
+
+def test_active_docker_id_with_image() -> None:
+    page = (
+        '<script>gon.image = {"id": 7, '
+        '"name": "gradescope/autograders:us-prod-docker_image-123456"};</script>'
+    )
+    session = _docker_page_session(page)
+    assignment = GSAssignmentEssential("1", "2", session=session)
+
+    assert assignment.get_active_docker_id() == "123456"
+    assert assignment.get_active_docker_id() == "123456"
+    assert session.get.call_count == 1
+
+
+def test_active_docker_id_without_match() -> None:
+    page = "<script>gon.course = {};</script>"
+    assignment = GSAssignmentEssential("1", "2", session=_docker_page_session(page))
+
+    assert assignment.get_active_docker_id() is None
+    assert assignment.docker_id is None
@@ -1,3 +1,5 @@
+import os
+from types import ModuleType
 from typing import Any, Tuple
 
 import pytest
@@ -140,6 +142,69 @@ def test_load_auto_inject() -> None:
     Problem.from_path(INJECTION_PROBLEM_FOLDER / "auto_inject.py")
 
 
+def test_injection_setup_deduplicates_paths() -> None:
+    content = INJECTION_PROBLEM_FOLDER / "temp_injected_content.py"
+    handler = InjectionHandler().setup(
+        False, [content, content.parent / ".." / content.parent.name / content.name]
+    )
+
+    assert len(handler.content_to_be_injected) == 1
+
+
+def test_reinjection_reuses_loaded_content() -> None:
+    content = [INJECTION_PROBLEM_FOLDER / "temp_injected_content.py"]
+    first, second = ModuleType("first"), ModuleType("second")
+
+    InjectionHandler().setup(False, content).inject(first)
+    InjectionHandler().setup(False, content).inject(second)
+
+    assert first.generate_multiple_two_numbers is second.generate_multiple_two_numbers
+
+
+def test_reinjection_reloads_content_edited_within_same_mtime(tmp_path) -> None:
+    content = tmp_path / "edited.py"
+    content.write_text("value = 1\n")
+    mtime_ns = content.stat().st_mtime_ns
+    first, second = ModuleType("first"), ModuleType("second")
+
+    InjectionHandler().setup(False, [content]).inject(first)
+    content.write_text("value = 100\n")
+    os.utime(content, ns=(mtime_ns, mtime_ns))
+    InjectionHandler().setup(False, [content]).inject(second)
+
+    assert (first.value, second.value) == (1, 100)
+
+
+def test_later_injection_overrides_earlier(tmp_path) -> None:
+    first, second = tmp_path / "first.py", tmp_path / "second.py"
+    first.write_text("value = 1\nonly_first = True\n")
+    second.write_text("value = 2\n")
+    module = ModuleType("injected")
+
+    InjectionHandler().setup(False, [first, second]).inject(module)
+
+    assert module.value == 2
+    assert module.only_first
+
+
+def test_injection_can_import_earlier_injections(tmp_path) -> None:
+    injection_dir = tmp_path / "gap_injection"
+    injection_dir.mkdir()
+    (injection_dir / "a_base.py").write_text("def helper():\n    return 1\n")
+    (injection_dir / "b_uses.py").write_text(
+        "from gapper.injection import helper\n\n\n"
+        "def uses():\n    return helper() + 1\n"
+    )
+
+    InjectionHandler().setup(
+        False, [injection_dir / "a_base.py", injection_dir / "b_uses.py"]
+    ).inject()
+
+    from gapper.injection import uses  # type: ignore
+
+    assert uses() == 2
+
+
 @pytest.mark.parametrize(
     "inputs, expected",
     [
@@ -48,6 +48,14 @@ def test_invalid_total_score() -> None:
         _ = ResultSynthesizer().total_score
 
 
+def test_results_are_copied() -> None:
+    results = [TestResult("dummy result", max_score=1)]
+    synthesizer = ResultSynthesizer(results=results, total_score=1)
+    synthesizer.results.append(TestResult("post test result", max_score=1))
+
+    assert len(results) == 1
+
+
 def test_synthesize_score_with_weight() -> None:
     results = [
         TestResult("dummy test", max_score=1, pass_status="passed"),
@@ -70,6 +78,25 @@ def test_synthesize_score_with_weight() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "results",
+    [
+        [
+            TestResult("dummy test", weight=w, pass_status="passed")
+            for w in (5, 5, 5, 3)
+        ],
+        [
+            TestResult("dummy test", weight=4, pass_status="passed"),
+            TestResult("dummy test", max_score=1.1, pass_status="passed"),
+            TestResult("dummy test", max_score=1.1, pass_status="passed"),
+            TestResult("dummy test", weight=1, pass_status="passed"),
+        ],
+    ],
+)
+def test_full_marks_are_not_under_or_over_reported(results) -> None:
+    assert ResultSynthesizer.synthesize_score_for(results=results, total_score=10) == 10
+
+
 def test_extra_points_added() -> None:
     results = [
         TestResult("dummy test", max_score=1, pass_status="passed", extra_points=3),
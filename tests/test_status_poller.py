@@ -0,0 +1,65 @@
+import asyncio
+from typing import List
+
+import pytest
+from gapper.connect.api.assignment import DockerStatusJson, GSAssignmentEssential
+from gapper.connect.api.status_poller import StatusPoller
+
+
+class _FakeAssignment(GSAssignmentEssential):
+    def __init__(self, cid: str, aid: str, statuses: List[str | Exception]) -> None:
+        super().__init__(cid, aid)
+        self.statuses = statuses
+        self.calls = 0
+
+    def get_docker_build_status(self) -> DockerStatusJson:
+        status = self.statuses[min(self.calls, len(self.statuses) - 1)]
+        self.calls += 1
+        if isinstance(status, Exception):
+            raise status
+        return {"status": status, "stdout": "", "stderr": ""}  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_subscribers_of_same_assignment_share_requests() -> None:
+    poller = StatusPoller(initial_interval=0.01, max_interval=0.01)
+    assignment = _FakeAssignment("1", "2", ["building", "built"])
+
+    first = poller.subscribe(assignment)
+    second = poller.subscribe(_FakeAssignment("1", "2", ["never polled"]))
+
+    for queue in (first, second):
+        assert (await queue.get())["status"] == "building"
+        assert (await queue.get())["status"] == "built"
+
+    assert assignment.calls == 2
+
+    poller.unsubscribe(assignment, first)
+    poller.unsubscribe(assignment, second)
+
+
+@pytest.mark.asyncio
+async def test_polling_stops_without_subscribers() -> None:
+    poller = StatusPoller(initial_interval=10, max_interval=10)
+    assignment = _FakeAssignment("1", "2", ["building"])
+
+    queue = poller.subscribe(assignment)
+    await queue.get()
+    poller.unsubscribe(assignment, queue)
+
+    await asyncio.wait_for(poller._task, 1)
+    assert assignment.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_polls_are_put_into_queue() -> None:
+    poller = StatusPoller(initial_interval=0.01, max_interval=0.01)
+    error = ValueError("status endpoint failed")
+    assignment = _FakeAssignment("1", "2", [error, "built"])
+
+    queue = poller.subscribe(assignment)
+
+    assert await queue.get() is error
+    assert (await queue.get())["status"] == "built"
+
+    poller.unsubscribe(assignment, queue)
@@ -56,6 +56,10 @@ def test_test_result_rich_name() -> None:
     custom_name = "test_name"
     result.set_name(custom_name)
     assert result.rich_test_name == f"{custom_name} {default_name}"
+    result.set_name("")
+    assert result.rich_test_name == default_name
+    result.name = custom_name
+    assert result.rich_test_name == f"{custom_name} {default_name}"
 
 
 def test_test_result_rich_output() -> None:
@@ -108,3 +112,11 @@ def test_test_result_rich_output() -> None:
         "  Stack Trace: \n"
         "    Not Provided\n"
     )
+
+
+def test_test_result_is_slotted() -> None:
+    result = TestResult("test")
+    assert not hasattr(result, "__dict__")
+
+    with pytest.raises(AttributeError):
+        result.unknown_attribute = "value"  # type: ignore[attr-defined]
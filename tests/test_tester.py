@@ -105,3 +105,16 @@ def test_post_test(request: pytest.FixtureRequest) -> None:
     assert len(tester.problem.test_cases) + len(tester.problem.post_tests_hooks) == len(
         results
     )
+
+
+def test_run_tears_down_pre_and_post_tests(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prob_name = "assess_post_tests.py"
+    tester: Tester = request.getfixturevalue(make_tester_name(prob_name))
+
+    torn_down: list[HookTypes] = []
+    monkeypatch.setattr(tester, "tear_down_hooks", torn_down.append)
+
+    tester.load_submission_from_path(TEST_SUBMISSIONS_FOLDER / prob_name).run()
+    assert torn_down == [HookTypes.PRE_TESTS, HookTypes.POST_TESTS]